@@ -4,28 +4,68 @@ Batch converter that adapts the josn-result JSON files into the jsontohwpx CLI f
 
 Usage:
     python scripts/batch_convert.py josn-result/*.json
+    python scripts/batch_convert.py --input-glob 'josn-result/*.json'
 
 The script streams each converted JSON into jsontohwpx via stdin so that large
-inputs don't require temporary files on disk.
+inputs don't require temporary files on disk. Articles are converted
+concurrently; use --jobs to control how many converter processes run at once.
+If the optional ``ijson`` package is installed, input files are parsed
+incrementally instead of being loaded into memory in one go, and ``orjson``
+is used to serialise the requests sent to the converter when available.
+
+When the converter advertises a ``--server`` flag in its ``--help`` output,
+each worker keeps a single converter process alive and feeds it one job per
+line instead of starting a new process per article (see ConverterServer for
+the protocol). Otherwise one ``jsontohwpx -`` process is run per article.
 """
 
 import argparse
+import glob
 import json
+import os
 import re
 import subprocess
 import sys
-from datetime import datetime
+import threading
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from functools import partial
+from itertools import count, islice
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Set
+from typing import IO, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Convert article dumps to HWPX files.")
     parser.add_argument(
         "inputs",
-        nargs="+",
+        nargs="*",
         help="Input JSON files (each must contain a list of article records).",
     )
+    parser.add_argument(
+        "--input-glob",
+        help=(
+            "Glob pattern for input files, expanded lazily by the script instead of the shell "
+            "(avoids argument list limits for very large directories). Files are processed "
+            "in directory order, which is not necessarily the sorted order a shell uses."
+        ),
+    )
     parser.add_argument(
         "--converter",
         default="target/release/jsontohwpx",
@@ -52,14 +92,130 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Name output files as '<title>_<YYYY-MM-DD>.hwpx' using metadata.created_at.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of converter processes to run concurrently (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--queue-depth",
+        type=int,
+        default=None,
+        help=(
+            "Maximum number of articles submitted but not yet converted "
+            "(default: min(32, 2 * --jobs)). Never less than --jobs, so every "
+            "worker can stay busy."
+        ),
+    )
+    parser.add_argument(
+        "--pin-cpus",
+        action="store_true",
+        help="Pin each worker's converter process to its own CPU (Linux only).",
+    )
+    args = parser.parse_args()
+    if not args.inputs and not args.input_glob:
+        parser.error("at least one input file or --input-glob is required")
+
+    args.jobs = max(1, args.jobs)
+    if args.queue_depth is None:
+        args.queue_depth = min(32, 2 * args.jobs)
+    # 큐가 워커 수보다 작으면 일부 워커가 놀게 됨
+    args.queue_depth = max(args.jobs, args.queue_depth)
+    return args
+
+
+# 입력 파일 파싱 오류 (json.JSONDecodeError는 ValueError의 하위 클래스)
+JSON_ERRORS: Tuple[type, ...] = (ValueError,) if ijson is None else (ValueError, ijson.JSONError)
+
+
+def one_line(exc: BaseException) -> str:
+    # ijson(yajl) 오류 메시지는 여러 줄에 걸친 위치 표시를 포함함
+    return " ".join(str(exc).split())
+
+
+def iter_articles(fh: IO[bytes]) -> Optional[Iterator[Dict]]:
+    """Yield article records one at a time from a JSON array.
+
+    With ijson installed the array is streamed, so memory stays flat no matter
+    how large the dump is. Otherwise the whole file is loaded with json.load.
+    Returns None when the top-level value is not a list.
+    """
+    if ijson is not None:
+        # 첫 이벤트로 최상위 배열 여부를 확인한 뒤 처음부터 다시 스트리밍
+        _, event, _ = next(ijson.parse(fh))
+        if event != "start_array":
+            return None
+        fh.seek(0)
+        # use_float: ijson은 기본적으로 Decimal을 반환하는데 JSON으로 다시 직렬화되지 않음
+        return ijson.items(fh, "item", use_float=True)
+
+    # orjson.loads는 쓰지 않음: NaN 등을 거부하고 64비트를 넘는 정수를 float로 바꿈
+    articles = json.load(fh)
+    if not isinstance(articles, list):
+        return None
+    return iter(articles)
+
+
+# 파이프 버퍼를 키워 Python/Rust 간 컨텍스트 스위칭 감소 (Python 3.10+, Linux)
+_PIPE_KWARGS: Dict = {"pipesize": 1024 * 1024} if sys.version_info >= (3, 10) else {}
+
+
+def start_converter(cmd: List[str], **kwargs) -> subprocess.Popen:
+    """Popen ``cmd``, enlarging its pipes when the kernel allows it.
+
+    Unprivileged users get EPERM from F_SETPIPE_SZ once their pipe buffer
+    quota is used up (many workers or server-mode pipes). The pipe size is a
+    tuning knob only, so on failure the process is started with default
+    pipes and later calls stop asking for larger ones.
+    """
+    global _PIPE_KWARGS
+    if _PIPE_KWARGS:
+        try:
+            return subprocess.Popen(cmd, **kwargs, **_PIPE_KWARGS)
+        except OSError:
+            proc = subprocess.Popen(cmd, **kwargs)
+            _PIPE_KWARGS = {}
+            return proc
+    return subprocess.Popen(cmd, **kwargs)
+
+
+def write_json(value: Dict, stream: IO[bytes]) -> None:
+    """Serialise ``value`` as UTF-8 JSON and write it to ``stream``.
+
+    The stdlib fallback serialises in one ``json.dumps`` call: ``json.dump``
+    would stream, but only through the pure-Python encoder, which costs
+    several times more CPU per article. ``stream`` is left open.
+    """
+    if orjson is not None:
+        stream.write(orjson.dumps(value))
+        return
+    stream.write(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+
+
+# 탭/개행을 제외한 C0 제어 문자
+_CONTROL_CHARS_TABLE = {c: None for c in range(0x20) if chr(c) not in "\n\r\t"}
+_CONTROL_CHARS_RE = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]+")
 
 
 def strip_control_chars(value: str) -> str:
-    return "".join(ch for ch in value if (ord(ch) >= 0x20) or ch in "\n\r\t")
+    # str.translate는 ASCII 문자열에서만 빠르고, 한글 등 비ASCII 문자열은
+    # 문자마다 테이블을 조회하므로 정규식 스캔이 훨씬 빠름
+    if value.isascii():
+        return value.translate(_CONTROL_CHARS_TABLE)
+    return _CONTROL_CHARS_RE.sub("", value)
+
 
+def stringify_number(value: object) -> object:
+    # 변환기 모델의 문자열 필드에 들어온 숫자(예: 숫자형 id)만 문자열로 변환.
+    # bool/dict/list 등은 그대로 두어 해당 레코드가 이전처럼 실패하도록 함
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    return value
 
-def normalise_text(value: Optional[str]) -> Optional[str]:
+
+def normalise_text(value: object) -> Optional[str]:
+    value = stringify_number(value)
     if value is None:
         return None
     text = strip_control_chars(value).strip()
@@ -69,19 +225,17 @@ def normalise_text(value: Optional[str]) -> Optional[str]:
 def build_contents(article: Dict) -> List[Dict]:
     # content 배열이 있으면 우선 사용 (이미지, 테이블 등 포함)
     contents: List[Dict] = []
-    for block in article.get("content", []):
+    for block in article.get("content", ()):
         block_type = block.get("type")
-        if block_type == "text":
-            text = block.get("value")
-            text = normalise_text(text)
-            if text:
-                contents.append({"type": "text", "value": text})
-        elif block_type == "link":
-            text_part = block.get("text") or block.get("value") or ""
-            url = block.get("url") or ""
-            text = f"{text_part} ({url})".strip()
-            text = normalise_text(text)
-            if text:
+        if block_type == "text" or block_type == "link":
+            if block_type == "text":
+                raw_text = block.get("value")
+            else:
+                text_part = block.get("text") or block.get("value") or ""
+                url = block.get("url") or ""
+                raw_text = f"{text_part} ({url})"
+            # normalise_text가 양끝 공백까지 정리하므로 별도 strip 불필요
+            if text := normalise_text(raw_text):
                 contents.append({"type": "text", "value": text})
         elif block_type == "image":
             # 원본 JSON에서 url 필드가 있으면 url로 전달, 없으면 value 사용
@@ -112,7 +266,31 @@ def build_contents(article: Dict) -> List[Dict]:
     return []
 
 
-def ensure_unique_id(candidates: List[Optional[str]], used_ids: Set[str]) -> str:
+def claim_unique_name(base: str, used: Dict[str, int]) -> str:
+    """Return ``base`` or the first free ``base_N`` (N >= 2) and mark it used.
+
+    ``used`` maps every name handed out so far to the last suffix tried for
+    it, so repeated collisions on the same base resume where they left off
+    instead of rescanning from ``_2``.
+    """
+    if base not in used:
+        used[base] = 1
+        return base
+
+    counter = used[base]
+    while True:
+        counter += 1
+        candidate = f"{base}_{counter}"
+        if candidate not in used:
+            break
+
+    used[base] = counter
+    used[candidate] = 1
+    return candidate
+
+
+def ensure_unique_id(candidates: Sequence[Optional[str]], used_ids: Dict[str, int]) -> str:
+    # 대체 id 포맷팅은 후보가 모두 비어 있을 때(for-else)만 수행
     for candidate in candidates:
         candidate = normalise_text(candidate)
         if candidate:
@@ -120,17 +298,21 @@ def ensure_unique_id(candidates: List[Optional[str]], used_ids: Set[str]) -> str
     else:
         candidate = f"ARTICLE_{len(used_ids)+1:05d}"
 
-    base = candidate
-    counter = 1
-    while candidate in used_ids:
-        counter += 1
-        candidate = f"{base}_{counter}"
+    return claim_unique_name(candidate, used_ids)
 
-    used_ids.add(candidate)
-    return candidate
+
+# 로케일별 표기와 구분자 정규화 (오전/오후 -> AM/PM, 2024.01.02 -> 2024-01-02)
+_DATE_REPLACEMENTS: Sequence[Tuple[str, str]] = (
+    ("오전", "AM"),
+    ("오후", "PM"),
+    (".", "-"),
+)
 
 
 def try_parse_created_date(raw: Optional[str]) -> Optional[str]:
+    # --title-date-name에서만 쓰이므로 필요할 때 import
+    from datetime import datetime
+
     if not raw:
         return None
 
@@ -138,27 +320,25 @@ def try_parse_created_date(raw: Optional[str]) -> Optional[str]:
     if not text:
         return None
 
-    # Normalise locale-specific markers and delimiters
-    replacements = {
-        "오전": "AM",
-        "오후": "PM",
-        ".": "-",
-    }
-    for src, dst in replacements.items():
+    for src, dst in _DATE_REPLACEMENTS:
         text = text.replace(src, dst)
 
-    patterns: Sequence[str] = (
-        "%Y-%m-%d %p %I:%M:%S",
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%d",
-    )
-    for pattern in patterns:
-        try:
-            dt = datetime.strptime(text, pattern)
-            return dt.strftime("%Y-%m-%d")
-        except ValueError:
-            continue
-    return None
+    # 문자열 형태로 포맷을 먼저 고른 뒤 strptime은 한 번만 호출
+    # (%p는 대소문자를 구분하지 않으므로 am/pm도 같은 포맷으로 처리)
+    upper = text.upper()
+    if "AM" in upper or "PM" in upper:
+        pattern = "%Y-%m-%d %p %I:%M:%S"
+    elif len(text.split()) > 1:
+        # strptime은 포맷의 공백을 임의의 공백 문자열(탭, 개행, 전각 공백 등)과 대응시킴
+        pattern = "%Y-%m-%d %H:%M:%S"
+    else:
+        pattern = "%Y-%m-%d"
+
+    try:
+        dt = datetime.strptime(text, pattern)
+    except ValueError:
+        return None
+    return dt.strftime("%Y-%m-%d")
 
 
 _INVALID_FILENAME_CHARS = re.compile(r"[\\/:*?\"<>|]+")
@@ -171,30 +351,22 @@ def safe_filename_component(value: str) -> str:
     return cleaned
 
 
-def ensure_unique_filename(base: str, used_names: Set[str]) -> str:
+def ensure_unique_filename(base: str, used_names: Dict[str, int]) -> str:
     if not base:
         base = "document"
-
-    candidate = base
-    counter = 1
-    while candidate in used_names:
-        counter += 1
-        candidate = f"{base}_{counter}"
-
-    used_names.add(candidate)
-    return candidate
+    return claim_unique_name(base, used_names)
 
 
 def build_output_basename(
     raw_article: Dict,
     metadata: Dict,
     fallback_id: str,
-    used_filenames: Set[str],
+    used_filenames: Dict[str, int],
     use_title_date_name: bool,
 ) -> str:
     if use_title_date_name:
         title = normalise_text(raw_article.get("title"))
-        created = try_parse_created_date(metadata.get("created_at"))
+        created = try_parse_created_date(stringify_number(metadata.get("created_at")))
 
         parts = []
         if title:
@@ -215,20 +387,35 @@ def build_output_basename(
     return ensure_unique_filename(safe_candidate, used_filenames)
 
 
-def convert_article(
+class ConversionJob(NamedTuple):
+    index: int
+    response: Dict
+    output_path: Path
+
+
+def build_response_template(include_header: bool) -> Dict:
+    return {
+        "responseCode": "0",
+        "responseText": "SUCCESS",
+        "options": {"includeHeader": include_header},
+    }
+
+
+def prepare_job(
+    index: int,
     raw_article: Dict,
-    include_header: bool,
-    converter: Path,
+    response_template: Dict,
     output_dir: Path,
-    used_ids: Set[str],
-    used_filenames: Set[str],
+    used_ids: Dict[str, int],
+    used_filenames: Dict[str, int],
     use_title_date_name: bool,
-) -> str:
+) -> ConversionJob:
+    # id/파일명 중복 검사는 공유 상태를 쓰므로 메인 스레드에서 순서대로 처리
     atcl_id = ensure_unique_id(
-        [
+        (
             raw_article.get("article_id"),
             raw_article.get("id"),
-        ],
+        ),
         used_ids,
     )
 
@@ -237,23 +424,21 @@ def convert_article(
     if not isinstance(metadata, dict):
         metadata = {}
 
+    # 고정 필드는 response_template에서 공유하고 data만 기사별로 생성
     response = {
-        "responseCode": "0",
-        "responseText": "SUCCESS",
-        "options": {"includeHeader": include_header},
+        **response_template,
         "data": {
             "article": {
                 "atclId": atcl_id,
-                "subject": raw_article.get("title") or "",
+                "subject": stringify_number(raw_article.get("title")) or "",
                 "contents": contents,
-                "regDt": metadata.get("created_at"),
-                "regEmpName": metadata.get("author"),
-                "regDeptName": metadata.get("department"),
+                "regDt": stringify_number(metadata.get("created_at")),
+                "regEmpName": stringify_number(metadata.get("author")),
+                "regDeptName": stringify_number(metadata.get("department")),
             }
         },
     }
 
-    output_dir.mkdir(parents=True, exist_ok=True)
     base_name = build_output_basename(
         raw_article,
         metadata,
@@ -261,22 +446,278 @@ def convert_article(
         used_filenames,
         use_title_date_name,
     )
-    output_path = output_dir / f"{base_name}.hwpx"
-    cmd = [str(converter), "-", "--output", str(output_path)]
+    return ConversionJob(index, response, output_dir / f"{base_name}.hwpx")
+
+
+class CpuPinner:
+    """Gives each worker thread a CPU from this process's affinity mask.
+
+    Converter processes started by a worker are pinned to that worker's CPU,
+    so they are not migrated between cores mid-conversion.
+    """
+
+    def __init__(self) -> None:
+        self.cpus = sorted(os.sched_getaffinity(0))
+        self._slots = count()
+        self._local = threading.local()
+
+    def pin(self, pid: int) -> None:
+        cpu = getattr(self._local, "cpu", None)
+        if cpu is None:
+            cpu = self.cpus[next(self._slots) % len(self.cpus)]
+            self._local.cpu = cpu
+        try:
+            os.sched_setaffinity(pid, {cpu})
+        except OSError:
+            # 이미 종료된 프로세스 등; 고정은 최적화일 뿐이므로 무시
+            pass
+
+
+def convert_article(
+    job: ConversionJob,
+    converter: Path,
+    include_header: bool,
+    pinner: Optional[CpuPinner] = None,
+) -> str:
+    cmd = [str(converter), "-", "--output", str(job.output_path)]
     if include_header:
         cmd.append("--include-header")
 
-    proc = subprocess.run(
+    proc = start_converter(
         cmd,
-        input=json.dumps(response, ensure_ascii=False).encode("utf-8"),
+        stdin=subprocess.PIPE,
         stdout=sys.stdout,
         stderr=sys.stderr,
-        check=False,
     )
-    if proc.returncode != 0:
-        raise subprocess.CalledProcessError(proc.returncode, cmd)
+    if pinner is not None:
+        pinner.pin(proc.pid)
+    # 변환기가 입력을 다 읽기 전에 종료되면 BrokenPipeError; 아래 종료 코드로 보고
+    try:
+        write_json(job.response, proc.stdin)
+    except BrokenPipeError:
+        pass
+    try:
+        proc.stdin.close()
+    except BrokenPipeError:
+        pass
+    returncode = proc.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
+    return job.output_path.name
+
+
+def converter_supports_server(converter: Path) -> bool:
+    try:
+        proc = subprocess.run(
+            [str(converter), "--help"],
+            capture_output=True,
+            check=False,
+            timeout=30,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return b"--server" in proc.stdout
+
+
+class ConverterServer:
+    """A long-lived ``jsontohwpx --server`` process.
+
+    Jobs are written to the converter's stdin as NDJSON, one
+    ``{"output_path": ..., "response": {...}}`` object per line. For every job
+    the converter answers with exactly one JSON line on stdout: ``{"ok": true}``
+    on success or ``{"ok": false, "error": "..."}`` on failure. The converter
+    exits once stdin is closed.
+    """
+
+    def __init__(
+        self,
+        converter: Path,
+        include_header: bool,
+        pinner: Optional[CpuPinner] = None,
+    ) -> None:
+        self.cmd = [str(converter), "--server"]
+        if include_header:
+            self.cmd.append("--include-header")
+        self.proc = start_converter(
+            self.cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=sys.stderr,
+        )
+        if pinner is not None:
+            pinner.pin(self.proc.pid)
+        self.alive = True
+
+    def convert(self, job: ConversionJob) -> str:
+        try:
+            write_json(
+                {"output_path": str(job.output_path), "response": job.response},
+                self.proc.stdin,
+            )
+            self.proc.stdin.write(b"\n")
+            self.proc.stdin.flush()
+            status_line = self.proc.stdout.readline()
+        except OSError:
+            # 변환기 프로세스가 죽음 (BrokenPipeError 등)
+            self.alive = False
+            raise
+
+        if not status_line:
+            self.alive = False
+            raise subprocess.CalledProcessError(self.proc.wait(), self.cmd)
+        try:
+            status = json.loads(status_line)
+        except ValueError:
+            status = None
+        if not isinstance(status, dict):
+            # 응답 순서가 어긋났으므로 프로세스를 버리고 새로 시작하게 함
+            self.alive = False
+            self.proc.kill()
+            raise RuntimeError(f"invalid status line from converter: {status_line[:200]!r}")
+        if not status.get("ok"):
+            raise RuntimeError(status.get("error") or "conversion failed")
+        return job.output_path.name
+
+    def close(self) -> None:
+        try:
+            self.proc.stdin.close()
+        except BrokenPipeError:
+            # 이미 종료된 프로세스; 남은 버퍼는 버리고 종료만 기다림
+            pass
+        self.proc.wait()
+
+
+class ConverterServerPool:
+    """Hands each worker thread its own ConverterServer."""
+
+    def __init__(
+        self,
+        converter: Path,
+        include_header: bool,
+        pinner: Optional[CpuPinner] = None,
+    ) -> None:
+        self.converter = converter
+        self.include_header = include_header
+        self.pinner = pinner
+        self._local = threading.local()
+        self._servers: List[ConverterServer] = []
+        self._lock = threading.Lock()
+
+    def convert(self, job: ConversionJob) -> str:
+        server = getattr(self._local, "server", None)
+        if server is None:
+            server = ConverterServer(self.converter, self.include_header, self.pinner)
+            self._local.server = server
+            with self._lock:
+                self._servers.append(server)
+        try:
+            return server.convert(job)
+        finally:
+            # 죽은 프로세스는 버리고 이 워커의 다음 작업에서 새로 시작
+            if not server.alive:
+                self._local.server = None
+
+    def close(self) -> None:
+        for server in self._servers:
+            server.close()
+
+
+def report_result(future: Future, idx: int, input_path: Path) -> None:
+    try:
+        output_name = future.result()
+        print(f"  - [#{idx}] -> {output_name}")
+    except Exception as exc:  # pragma: no cover - manual script
+        print(
+            f"  ! Failed to convert record #{idx} in {input_path}: {exc}",
+            file=sys.stderr,
+        )
 
-    return output_path.name
+
+def convert_input_file(
+    input_path: Path,
+    args: argparse.Namespace,
+    executor: Executor,
+    convert: Callable[[ConversionJob], str],
+    base_output_dir: Path,
+    response_template: Dict,
+) -> None:
+    target_dir = base_output_dir / input_path.stem
+    used_ids: Dict[str, int] = {}
+    used_filenames: Dict[str, int] = {}
+    futures: Dict[Future, int] = {}
+
+    # 스트리밍 중에는 파일 핸들이 열려 있어야 함
+    with input_path.open("rb") as fh:
+        try:
+            articles = iter_articles(fh)
+        except JSON_ERRORS as exc:
+            print(
+                f"[WARN] failed to parse {input_path}: {one_line(exc)}; skipping",
+                file=sys.stderr,
+            )
+            return
+        if articles is None:
+            print(f"[WARN] {input_path} does not contain a list; skipping", file=sys.stderr)
+            return
+
+        target_dir.mkdir(parents=True, exist_ok=True)
+
+        limit = args.max_per_file
+        if limit is not None and limit > 0:
+            articles_to_process = islice(articles, limit)
+            print(f"[INFO] Converting {input_path} -> {target_dir} (up to {limit} articles)")
+        else:
+            articles_to_process = articles
+            print(f"[INFO] Converting {input_path} -> {target_dir}")
+
+        try:
+            for idx, article in enumerate(articles_to_process, start=1):
+                try:
+                    job = prepare_job(
+                        idx,
+                        article,
+                        response_template,
+                        target_dir,
+                        used_ids,
+                        used_filenames,
+                        args.title_date_name,
+                    )
+                except Exception as exc:  # pragma: no cover - manual script
+                    print(
+                        f"  ! Failed to convert record #{idx} in {input_path}: {exc}",
+                        file=sys.stderr,
+                    )
+                    continue
+
+                # 대기 중인 작업이 queue_depth에 도달하면 하나 이상 끝날 때까지 대기
+                if len(futures) >= args.queue_depth:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        report_result(future, futures.pop(future), input_path)
+                futures[executor.submit(convert, job)] = idx
+        except JSON_ERRORS as exc:
+            # 스트리밍 중 파싱 오류: 이미 제출한 기사는 마저 변환하고 나머지는 건너뜀
+            print(
+                f"[WARN] failed to parse {input_path}: {one_line(exc)}; "
+                "skipping the rest of the file",
+                file=sys.stderr,
+            )
+
+    # 완료되는 순서대로 진행 상황 출력
+    for future in as_completed(futures):
+        report_result(future, futures[future], input_path)
+
+
+def iter_input_paths(args: argparse.Namespace) -> Iterator[str]:
+    yield from args.inputs
+    if args.input_glob:
+        matched = False
+        for path in glob.iglob(args.input_glob, recursive=True):
+            matched = True
+            yield path
+        if not matched:
+            print(f"[SKIP] no files match --input-glob: {args.input_glob}", file=sys.stderr)
 
 
 def main() -> None:
@@ -288,51 +729,45 @@ def main() -> None:
     base_output_dir = Path(args.output_dir)
     base_output_dir.mkdir(parents=True, exist_ok=True)
 
-    for input_path_str in args.inputs:
-        input_path = Path(input_path_str)
-        if not input_path.exists():
-            print(f"[SKIP] missing file: {input_path}", file=sys.stderr)
-            continue
-
-        with input_path.open(encoding="utf-8") as fh:
-            articles = json.load(fh)
-
-        if not isinstance(articles, list):
-            print(f"[WARN] {input_path} does not contain a list; skipping", file=sys.stderr)
-            continue
-
-        target_dir = base_output_dir / input_path.stem
-        target_dir.mkdir(parents=True, exist_ok=True)
-        used_ids: Set[str] = set()
+    response_template = build_response_template(args.include_header)
 
-        limit = args.max_per_file
-        if limit is not None and limit > 0:
-            articles_to_process = articles[:limit]
+    pinner: Optional[CpuPinner] = None
+    if args.pin_cpus:
+        if hasattr(os, "sched_setaffinity"):
+            pinner = CpuPinner()
         else:
-            articles_to_process = articles
+            print("[WARN] --pin-cpus is not supported on this platform; ignoring", file=sys.stderr)
 
-        print(
-            f"[INFO] Converting {input_path} -> {target_dir} "
-            f"({len(articles_to_process)}/{len(articles)} articles)"
+    servers: Optional[ConverterServerPool] = None
+    if converter_supports_server(converter):
+        servers = ConverterServerPool(converter, args.include_header, pinner)
+        convert: Callable[[ConversionJob], str] = servers.convert
+    else:
+        convert = partial(
+            convert_article,
+            converter=converter,
+            include_header=args.include_header,
+            pinner=pinner,
         )
-        used_filenames: Set[str] = set()
-        for idx, article in enumerate(articles_to_process, start=1):
-            try:
-                output_name = convert_article(
-                    article,
-                    args.include_header,
-                    converter,
-                    target_dir,
-                    used_ids,
-                    used_filenames,
-                    args.title_date_name,
-                )
-                print(f"  - [{idx}/{len(articles)}] -> {output_name}")
-            except Exception as exc:  # pragma: no cover - manual script
-                print(
-                    f"  ! Failed to convert record #{idx} in {input_path}: {exc}",
-                    file=sys.stderr,
+
+    try:
+        with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+            for input_path_str in iter_input_paths(args):
+                input_path = Path(input_path_str)
+                if not input_path.exists():
+                    print(f"[SKIP] missing file: {input_path}", file=sys.stderr)
+                    continue
+                convert_input_file(
+                    input_path,
+                    args,
+                    executor,
+                    convert,
+                    base_output_dir,
+                    response_template,
                 )
+    finally:
+        if servers is not None:
+            servers.close()
 
 
 if __name__ == "__main__":